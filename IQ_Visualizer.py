@@ -3,6 +3,7 @@ import matplotlib.pyplot as plt
 import json
 import os
 import pandas as pd
+import scipy.fft as sfft
 from scipy.stats import kurtosis
 
 def extract_capture_metadata(json_path):
@@ -35,21 +36,21 @@ def plot_signal_quality(iq, fs, symbol_len, step=None):
     time_axis = np.arange(len(mag)) / fs
     
     # Calculate sliding window Quality Score
-    qualities = []
-    quality_times = []
-    
-    for i in range(0, len(mag) - symbol_len, step):
-        window = mag[i : i + symbol_len]
-        mu = np.mean(window)
-        sigma = np.std(window)
-        
-        # Q = Mean / StdDev. 
-        # A clean ring (mu=1, sigma=small) results in a HIGH Q.
-        # Two rings/smearing (high sigma) results in a LOW Q.
-        q_score = mu / (sigma + 1e-6)
-        
-        qualities.append(q_score)
-        quality_times.append(time_axis[i + symbol_len // 2])
+    # All windows are measured at once from running sums of |x| and |x|^2,
+    # so each sample is touched once instead of once per overlapping window.
+    starts = np.arange(0, len(mag) - symbol_len, step)
+    csum = np.concatenate(([0.0], np.cumsum(mag, dtype=np.float64)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(np.square(mag, dtype=np.float64))))
+
+    mu = (csum[starts + symbol_len] - csum[starts]) / symbol_len
+    mean_sq = (csum_sq[starts + symbol_len] - csum_sq[starts]) / symbol_len
+    sigma = np.sqrt(np.maximum(mean_sq - mu**2, 0.0))
+
+    # Q = Mean / StdDev. 
+    # A clean ring (mu=1, sigma=small) results in a HIGH Q.
+    # Two rings/smearing (high sigma) results in a LOW Q.
+    qualities = mu / (sigma + 1e-6)
+    quality_times = time_axis[starts + symbol_len // 2]
 
     # Plotting
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
@@ -127,8 +128,10 @@ class IQDataManager:
             raw = np.fromfile(filename, dtype=np.int16)
             # Convert to float and normalize by max int16 value
             # This ensures the LoRaDetector sees the same 'amplitude' scale as cf32
-            raw = raw.astype(np.float32) / 32768.0
-            iq = raw[0::2] + 1j * raw[1::2]
+            # Interleaved I,Q float32 pairs share complex64's memory layout, so
+            # one widening copy + view replaces the strided I/Q gathers
+            iq = raw.astype(np.float32).view(np.complex64)
+            iq *= 1.0 / 32768.0
             print(f"[*] Loaded CS16 data: {len(iq)} complex samples.")
             
         else:
@@ -183,12 +186,26 @@ class IQVisualizer:
         start = len(iq) // 2
         data_chunk = iq[start : start + chunk_size]
         
-        window = np.blackman(len(data_chunk))
-        fft_data = np.fft.fftshift(np.fft.fft(data_chunk * window))
-        freq_bins = np.fft.fftshift(np.fft.fftfreq(len(data_chunk), 1/fs))
+        # float32 window keeps the product complex64; scipy.fft threads the
+        # transform and can reuse the windowed buffer as its output
+        window = np.blackman(len(data_chunk)).astype(np.float32)
+        fft_data = sfft.fft(data_chunk * window, overwrite_x=True, workers=-1)
+        n = len(fft_data)
+        # Equivalent to fftshift(fftfreq(n, 1/fs)) without the gather
+        freq_bins = (np.arange(n) - n // 2) * (fs / n)
         freq_axis_mhz = (freq_bins + center_freq) / 1e6
         
-        mag_db = 20 * np.log10(np.abs(fft_data) + 1e-12)
+        # 20*log10(|X| + eps) evaluated in place on a single magnitude buffer
+        mag = np.abs(fft_data)
+        mag += 1e-12
+        np.log10(mag, out=mag)
+        mag *= 20
+
+        # fftshift on the real dB buffer as two contiguous half copies
+        half = (n + 1) // 2
+        mag_db = np.empty_like(mag)
+        mag_db[:n - half] = mag[half:]
+        mag_db[n - half:] = mag[:half]
         mag_db -= np.max(mag_db)
         
         plt.plot(freq_axis_mhz, mag_db, color='tab:cyan')
@@ -26,6 +26,9 @@ class LoRaDetector:
         # Matched filter kernel: conjugate + time reversal of reference
         self.mf_kernel = np.conj(self.reference_chirp[::-1])
 
+        # Moving-average kernel is fixed by window_size; build it once
+        self.ma_kernel = np.ones(window_size) / window_size
+
     # ==========================================
     # --- SIGNAL GENERATION ---
     # ==========================================
@@ -205,8 +208,7 @@ class LoRaDetector:
 
     def moving_average(self, corr: np.ndarray) -> np.ndarray:
         corr = np.asarray(corr)
-        window = np.ones(self.window_size) / self.window_size
-        return np.convolve(corr, window, mode='same')
+        return np.convolve(corr, self.ma_kernel, mode='same')
 
     # ==========================================
     # --- DEBUG PLOTS ---
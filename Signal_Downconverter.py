@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+import scipy.fft as sfft
 from scipy.signal import firwin, filtfilt
 
 
@@ -29,9 +30,16 @@ class SignalDownConverter:
         Returns:
             Baseband-shifted complex IQ array.
         """
-        t = np.arange(len(iq_samples)) / self.fs
-        mixer = np.exp(-1j * 2.0 * np.pi * offset_hz * t)
-        return iq_samples * mixer
+        # Build the mixer in place: phase ramp -> cos/sin written straight into
+        # the real/imag parts, then the product reuses the mixer buffer.
+        phase = np.arange(len(iq_samples), dtype=np.float64)
+        phase *= -2.0 * np.pi * offset_hz / self.fs
+        # Mixer matches the input precision so complex64 captures are not
+        # promoted to complex128 (the phase itself stays float64)
+        mixer = np.empty(len(iq_samples), dtype=np.result_type(iq_samples, np.complex64))
+        np.cos(phase, out=mixer.real)
+        np.sin(phase, out=mixer.imag)
+        return np.multiply(iq_samples, mixer, out=mixer)
 
     def lowpass_filter(self, iq: np.ndarray, f_cutoff: float,
                        numtaps: int = 101, window: str = 'hamming') -> np.ndarray:
@@ -187,12 +195,27 @@ class SignalDownConverter:
         # the left, matching SDR convention.
         ax = axes[0]
         fft_size = len(iq)
-        win = np.blackman(fft_size)
-        spectrum = np.fft.fftshift(np.fft.fft(iq * win, fft_size))
-        mag_db = 20 * np.log10(np.abs(spectrum) / fft_size + 1e-12)
-
-        # fftfreq returns bin offsets from DC in Hz; add c for absolute frequency
-        bin_offsets_hz = np.fft.fftshift(np.fft.fftfreq(fft_size, d=1.0 / fs))
+        win = np.blackman(fft_size).astype(iq.real.dtype)  # no complex64 -> complex128 promotion
+        spectrum = sfft.fft(iq * win, overwrite_x=True, workers=-1)
+
+        # |X|/N -> dB in place on one float32 magnitude buffer (no per-op
+        # temporaries; display does not need float64 precision)
+        mag = np.empty(fft_size, dtype=np.float32)
+        np.abs(spectrum, out=mag)
+        mag /= fft_size
+        mag += 1e-12
+        np.log10(mag, out=mag)
+        mag *= 20
+
+        # fftshift applied to the real dB array (half the bytes of the complex
+        # spectrum) as two contiguous copies instead of a gather
+        half = (fft_size + 1) // 2
+        mag_db = np.empty_like(mag)
+        mag_db[:fft_size - half] = mag[half:]
+        mag_db[fft_size - half:] = mag[:half]
+
+        # Shifted bin offsets from DC in Hz; add c for absolute frequency
+        bin_offsets_hz = (np.arange(fft_size) - fft_size // 2) * (fs / fft_size)
         freqs_display = to_display(bin_offsets_hz + c)
 
         ax.plot(freqs_display, mag_db, linewidth=0.7, color='steelblue')
@@ -236,7 +259,11 @@ class SignalDownConverter:
         Zxx_shifted = np.fft.fftshift(Zxx, axes=0)        # match row order
         f_display = to_display(f_stft_shifted + c)         # absolute, display unit
 
-        power_db = 20 * np.log10(np.abs(Zxx_shifted) + 1e-12)
+        power_db = np.empty(Zxx_shifted.shape, dtype=np.float32)
+        np.abs(Zxx_shifted, out=power_db)
+        power_db += 1e-12
+        np.log10(power_db, out=power_db)
+        power_db *= 20
 
         im = ax.pcolormesh(t_stft, f_display, power_db,
                            shading='auto', cmap='viridis')
@@ -17,10 +17,15 @@ def view_spectrogram(iq, fs, nfft=1024, noverlap=None, cmap='viridis', db_scale=
     f = np.fft.fftshift(f)
     Sxx = np.fft.fftshift(Sxx, axes=0)
 
-    # 3. Compute power
-    power = np.abs(Sxx)**2
+    # 3. Compute power (float32 is plenty for display and halves the traffic)
+    # |X|^2 = re^2 + im^2 directly, skipping the per-bin sqrt inside np.abs
+    power = np.empty(Sxx.shape, dtype=np.float32)
+    np.square(Sxx.real, out=power)
+    power += np.square(Sxx.imag, dtype=np.float32)
     if db_scale:
-        power = 10 * np.log10(power + 1e-12)
+        power += 1e-12
+        np.log10(power, out=power)
+        power *= 10
 
     plt.figure(figsize=(10, 6))
     # Use kHz or MHz depending on your sample rate for readability
@@ -34,26 +34,38 @@ def run_rx_test():
         sdr.setGain(SOAPY_SDR_RX, 0, GAIN_DB) 
 
         # 3. Stream setup
-        # CF32 is Complex Float 32-bit (I & Q samples)
+        # CS16 is Complex Int 16-bit (interleaved I & Q) - the native sample
+        # width, so the driver skips its float conversion and USB carries half
+        # the bytes of CF32. We convert to complex64 ourselves below.
         print("Setting up receive stream...")
-        rxStream = sdr.setupStream(SOAPY_SDR_RX, SOAPY_SDR_CF32)
+        rxStream = sdr.setupStream(SOAPY_SDR_RX, SOAPY_SDR_CS16)
         sdr.activateStream(rxStream)
 
         # 4. Read samples
-        buff = np.zeros(NUM_SAMPLES, dtype=np.complex64)
+        buff = np.zeros(2 * NUM_SAMPLES, dtype=np.int16)
         
         # Read a block of data
         status = sdr.readStream(rxStream, [buff], NUM_SAMPLES)
         
         print("\n--- Capture Summary ---")
         print(f"ReadStream Status: {status.ret}")
-        print(f"Captured {NUM_SAMPLES} samples.")
-        print(f"First 5 samples (I/Q): {buff[:5]}")
+
+        # status.ret is the number of samples actually read (negative on error);
+        # a short read leaves the tail of buff unwritten, so only look at the head
+        if status.ret <= 0:
+            print("⚠️ WARNING: No samples returned. Check antenna, power, and drivers.")
+            return
+
+        # Widen int16 I,Q pairs to float32, view as complex64, scale to +/-1.0
+        samples = buff[:2 * status.ret].astype(np.float32).view(np.complex64)
+        samples *= 1.0 / 32768.0
+        print(f"Captured {status.ret} of {NUM_SAMPLES} samples.")
+        print(f"First 5 samples (I/Q): {samples[:5]}")
 
         # Basic check to see if the data is non-zero (i.e., we received something)
-        abs_values = np.abs(buff)
-        if np.mean(abs_values) > 1e-6:
-            print(f"✅ SUCCESS: Average signal magnitude is {np.mean(abs_values):.4f}. Data was successfully captured.")
+        mean_mag = np.mean(np.abs(samples))
+        if mean_mag > 1e-6:
+            print(f"✅ SUCCESS: Average signal magnitude is {mean_mag:.4f}. Data was successfully captured.")
         else:
             print("⚠️ WARNING: Average signal magnitude is very close to zero. Check antenna, power, and drivers.")
 